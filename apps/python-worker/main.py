@@ -6,15 +6,56 @@ other services can call during the preview/run phases of the import
 pipeline.
 """
 from __future__ import annotations
-from io import BytesIO
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedReader, BytesIO, RawIOBase
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote
+from zipfile import BadZipFile
 
 import asyncio
+import mmap
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import numpy as np
+import openpyxl
+import orjson
 import pandas as pd
+import polars as pl
+import xlrd
+import xxhash
 from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from pandas.tseries.api import guess_datetime_format
 from pydantic import BaseModel
+from python_calamine import CalamineError, CalamineSheet, CalamineWorkbook, SheetTypeEnum
+from xlrd import XL_CELL_BOOLEAN, XL_CELL_DATE, XL_CELL_ERROR, XLRDError, xldate
+from xlrd.compdoc import CompDocError
 
-from ml_pipeline import build_ml_preview
+from ml_pipeline import _DATE_SHAPE, build_ml_preview
 
 app = FastAPI(
     title="ML-TIKET Python Worker",
@@ -24,59 +65,230 @@ app = FastAPI(
         "remains in Node.js."
     ),
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
+# Legacy BIFF (.xls) workbooks are OLE2 compound documents; they are routed
+# through xlrd instead of the calamine reader.
+_OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Tokens ``pd.read_excel`` treats as missing by default, plus the remaining
+# Excel error literals: calamine already reports error cells as empty, so the
+# openpyxl/xlrd paths must not surface them as text either.
+_NA_TOKENS = frozenset(
+    {
+        "",
+        "#DIV/0!",
+        "#NAME?",
+        "#NULL!",
+        "#NUM!",
+        "#REF!",
+        "#VALUE!",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
+BOOLEAN_TOKENS = frozenset({"true", "1", "yes", "si", "sí", "false", "0", "no"})
+
 
 def _normalize_headers(columns: List[Any]) -> List[str]:
-    """Create stable, non-empty column headers and disambiguate duplicates."""
+    """Create stable, non-empty column headers and disambiguate duplicates.
+
+    A repeated label gets the next ``__N`` suffix that is neither another
+    header in the sheet nor a name generated earlier, so the result is unique.
+    """
+
+    labels = [
+        (str(column).strip() if column is not None else "") or f"col_{idx + 1}"
+        for idx, column in enumerate(columns)
+    ]
+    if len(set(labels)) == len(labels):
+        return labels
 
+    counts: Counter[str] = Counter()
+    taken: Set[str] = set(labels)
+    emitted: Set[str] = set()
     normalized: List[str] = []
-    seen: Dict[str, int] = {}
-    for idx, column in enumerate(columns):
-        label = str(column).strip() if column is not None else ""
-        if not label:
-            label = f"col_{idx + 1}"
-
-        count = seen.get(label, 0)
-        if count:
-            label = f"{label}__{count}"
-        seen[label] = count + 1
-        normalized.append(label)
+    for label in labels:
+        name = label
+        if name in emitted:
+            while name in taken:
+                counts[label] += 1
+                name = f"{label}__{counts[label]}"
+        taken.add(name)
+        emitted.add(name)
+        normalized.append(name)
 
     return normalized
 
 
-def _analyze_column_patterns(frame: pd.DataFrame) -> Dict[str, Dict[str, float]]:
-    """Profile each column to detect dominant data patterns and noise."""
+# Superset of what ``pd.to_numeric`` accepts; used to skip obvious free text.
+_NUMERIC_SHAPE = re.compile(
+    r"^[\d\s.,+\-eE]+$|^[+-]?(?:inf(?:inity)?|nan)$", re.IGNORECASE
+)
 
-    patterns: Dict[str, Dict[str, float]] = {}
-    boolean_truthy = {"true", "1", "yes", "si", "sí"}
-    boolean_falsy = {"false", "0", "no"}
 
-    for column in frame.columns:
-        series = frame[column].dropna()
-        if series.empty:
-            patterns[column] = {
-                "numeric_ratio": 0.0,
-                "date_ratio": 0.0,
-                "boolean_ratio": 0.0,
-                "unique_ratio": 0.0,
-            }
-            continue
+def _numeric_ratio(as_text: pd.Series) -> float:
+    """Share of values that parse as numbers, casting only numeric-looking ones."""
 
-        as_text = series.astype(str).str.strip()
-        numeric_ratio = float(pd.to_numeric(as_text, errors="coerce").notna().mean())
-        date_ratio = float(pd.to_datetime(as_text, errors="coerce").notna().mean())
-        boolean_ratio = float(
-            as_text.str.lower().isin(boolean_truthy.union(boolean_falsy)).mean()
-        )
-        unique_ratio = float(as_text.nunique(dropna=True) / max(len(as_text), 1))
+    candidates = as_text[as_text.str.match(_NUMERIC_SHAPE)]
+    if candidates.empty:
+        return 0.0
+    parsed = pd.to_numeric(candidates, errors="coerce")
+    return float(parsed.notna().sum() / len(as_text))
+
+
+def _date_ratio(as_text: pd.Series) -> float:
+    """Share of values that parse as dates, without per-cell format guessing.
+
+    The format is guessed once from the first value and reused for the whole
+    column. When no format can be guessed only date-shaped values are handed to
+    ``pd.to_datetime`` so free text never reaches the slow dateutil fallback.
+    """
+
+    has_digit = as_text.str.contains(r"\d", regex=True)
+    if not has_digit.any():
+        return 0.0
+
+    fmt = guess_datetime_format(as_text.iloc[0])
+    if fmt is not None:
+        parsed = pd.to_datetime(as_text[has_digit], format=fmt, errors="coerce")
+        return float(parsed.notna().sum() / len(as_text))
+
+    candidates = as_text[as_text.str.match(_DATE_SHAPE)]
+    if candidates.empty:
+        return 0.0
+    parsed = pd.to_datetime(candidates, errors="coerce")
+    return float(parsed.notna().sum() / len(as_text))
+
+
+PATTERN_SAMPLE_ROWS = 2_000
+
+
+def _pattern_sample(frame: pd.DataFrame, sample_rows: int) -> pd.DataFrame:
+    """Return a reproducible row sample used for column profiling."""
+
+    if len(frame) <= sample_rows:
+        return frame
+    return frame.sample(n=sample_rows, random_state=0)
+
+
+_EMPTY_PATTERN = {
+    "numeric_ratio": 0.0,
+    "date_ratio": 0.0,
+    "boolean_ratio": 0.0,
+    "unique_ratio": 0.0,
+}
+
+
+def _profile_column(as_text: pd.Series) -> Dict[str, float]:
+    """pandas implementation of the per-column ratios (used as a fallback)."""
+
+    return {
+        "numeric_ratio": _numeric_ratio(as_text),
+        "date_ratio": _date_ratio(as_text),
+        "boolean_ratio": float(as_text.str.lower().isin(BOOLEAN_TOKENS).mean()),
+        "unique_ratio": float(as_text.nunique(dropna=True) / max(len(as_text), 1)),
+    }
 
+
+def _pattern_exprs(name: str, first_value: str) -> List[pl.Expr]:
+    """Polars expressions computing the four pattern ratios of one column."""
+
+    text = pl.col(name).str.strip_chars()
+    non_null = text.is_not_null().sum()
+    fmt = guess_datetime_format(first_value)
+    if fmt is not None:
+        dates = text.str.to_datetime(format=fmt, strict=False)
+        date_ratio = dates.is_not_null().sum() / non_null
+    else:
+        # No guessable format: resolved with the pandas fallback below.
+        date_ratio = pl.lit(None, dtype=pl.Float64)
+
+    return [
+        # "nan" casts to NaN, which pd.to_numeric never counted as a number.
+        (
+            text.cast(pl.Float64, strict=False).fill_nan(None).is_not_null().sum()
+            / non_null
+        ).alias(f"{name}:numeric_ratio"),
+        date_ratio.alias(f"{name}:date_ratio"),
+        (text.str.to_lowercase().is_in(BOOLEAN_TOKENS).sum() / non_null).alias(
+            f"{name}:boolean_ratio"
+        ),
+        (text.drop_nulls().n_unique() / non_null).alias(f"{name}:unique_ratio"),
+    ]
+
+
+def _analyze_column_patterns(frame: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """Profile each column to detect dominant data patterns and noise.
+
+    Callers pass a row sample on large sheets; the ratios are only heuristics so
+    a couple of thousand rows is enough to keep them stable. The ratios for all
+    columns are computed by Polars in a single multi-threaded ``select``.
+    """
+
+    patterns: Dict[str, Dict[str, float]] = {}
+    profiled: List[Tuple[Any, str, pd.Series]] = []
+    for index, column in enumerate(frame.columns):
+        # Pre-filled so the result keeps the frame's column order.
+        patterns[column] = dict(_EMPTY_PATTERN)
+        series = frame[column].dropna()
+        if not series.empty:
+            profiled.append((column, str(index), series))
+
+    if not profiled:
+        return patterns
+
+    text_frame = pl.DataFrame(
+        [
+            pl.Series(
+                name,
+                frame[column].to_numpy(dtype=object, na_value=None).tolist(),
+                dtype=pl.String,
+            )
+            for column, name, _ in profiled
+        ]
+    )
+    try:
+        ratios = text_frame.select(
+            [
+                expr
+                for _, name, series in profiled
+                for expr in _pattern_exprs(name, str(series.iloc[0]).strip())
+            ]
+        ).row(0, named=True)
+    except pl.exceptions.PolarsError:
+        for column, _, series in profiled:
+            patterns[column] = _profile_column(series.astype(str).str.strip())
+        return patterns
+
+    for column, name, series in profiled:
+        date_ratio = ratios[f"{name}:date_ratio"]
+        if date_ratio is None:
+            date_ratio = _date_ratio(series.astype(str).str.strip())
         patterns[column] = {
-            "numeric_ratio": numeric_ratio,
-            "date_ratio": date_ratio,
-            "boolean_ratio": boolean_ratio,
-            "unique_ratio": unique_ratio,
+            "numeric_ratio": float(ratios[f"{name}:numeric_ratio"]),
+            "date_ratio": float(date_ratio),
+            "boolean_ratio": float(ratios[f"{name}:boolean_ratio"]),
+            "unique_ratio": float(ratios[f"{name}:unique_ratio"]),
         }
 
     return patterns
@@ -87,6 +299,7 @@ def _clean_sheet_dataframe(
     *,
     min_column_coverage: float = 0.12,
     min_row_signal: float = 0.18,
+    pattern_sample_rows: int = PATTERN_SAMPLE_ROWS,
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """Normalize headers, trim noise and drop sparse rows/columns.
 
@@ -97,155 +310,844 @@ def _clean_sheet_dataframe(
 
     normalized = frame.copy()
     normalized.columns = _normalize_headers(list(normalized.columns))
-    normalized = normalized.applymap(
-        lambda value: value.strip() if isinstance(value, str) else value
-    )
-    normalized.replace({"": pd.NA, " ": pd.NA}, inplace=True)
-
-    coverage = normalized.notna().mean().to_dict()
-    columns_to_keep = [
-        col for col, cov in coverage.items() if cov >= min_column_coverage
-    ]
-    pruned = normalized[columns_to_keep] if columns_to_keep else normalized
-    dropped_columns = len(normalized.columns) - len(pruned.columns)
-
-    row_signal = pruned.notna().mean(axis=1)
+    for column in normalized.select_dtypes(include="object").columns:
+        stripped = normalized[column].str.strip()
+        normalized[column] = stripped.mask(stripped == "")
+
+    # One NA mask serves both the column coverage and the row signal.
+    present = normalized.notna().to_numpy()
+    row_count, column_count = present.shape
+    if row_count:
+        column_share = present.sum(axis=0) / row_count
+    else:
+        column_share = np.full(column_count, np.nan)
+    coverage = dict(zip(normalized.columns, column_share.tolist()))
+
+    keep_columns = np.flatnonzero(column_share >= min_column_coverage)
+    if not len(keep_columns):
+        keep_columns = np.arange(column_count)
+    pruned = normalized.iloc[:, keep_columns]
+    dropped_columns = column_count - len(keep_columns)
+
+    if len(keep_columns):
+        row_signal = present[:, keep_columns].sum(axis=1) / len(keep_columns)
+    else:
+        row_signal = np.full(row_count, np.nan)
     filtered = pruned.loc[row_signal >= min_row_signal].reset_index(drop=True)
     dropped_rows = int(len(pruned) - len(filtered))
 
-    pattern_signals = _analyze_column_patterns(filtered)
+    pattern_frame = _pattern_sample(filtered, pattern_sample_rows)
+    pattern_signals = _analyze_column_patterns(pattern_frame)
 
     return filtered, {
         "dropped_rows": dropped_rows,
         "dropped_columns": dropped_columns,
         "column_coverage": {k: float(v) for k, v in coverage.items()},
         "pattern_signals": pattern_signals,
+        "pattern_sample_rows": len(pattern_frame),
     }
 
 
+# Uploads are plain bytes, or a read-only mmap of Starlette's spooled temp file
+# once the upload was large enough to roll over to disk.
+UploadBytes = Union[bytes, mmap.mmap]
+
+
+class _BufferReader(RawIOBase):
+    """Seekable read-only stream over a shared buffer with its own position.
+
+    Unlike ``BytesIO(mmap)`` this does not copy the mapping; each stream has
+    its own cursor over the same pages.
+    """
+
+    def __init__(self, buffer: UploadBytes) -> None:
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target: Any) -> int:
+        chunk = self._view[self._position : self._position + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += len(self._view)
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+def _byte_stream(file_bytes: UploadBytes) -> BinaryIO:
+    if isinstance(file_bytes, bytes):
+        return BytesIO(file_bytes)
+    return BufferedReader(_BufferReader(file_bytes))
+
+
+async def _read_upload(file: UploadFile) -> UploadBytes:
+    """Return the upload's content, memory-mapping large, disk-backed files.
+
+    Small uploads stay in Starlette's in-memory spool and are read as bytes.
+    Once the spool has rolled over to disk the temp file is memory-mapped, so
+    hashing and the openpyxl fallback read it without a heap copy. calamine
+    and xlrd still load the whole file into memory when the workbook is
+    opened, which happens once per request (see ``_UploadWorkbook``). The
+    upload digest scans the whole file right away, so the kernel is asked to
+    start readahead for all of it.
+    """
+
+    spooled = file.file
+    if not getattr(spooled, "_rolled", False):
+        return await file.read()
+
+    spooled.flush()
+    if os.fstat(spooled.fileno()).st_size == 0:
+        return b""
+    mapped = mmap.mmap(spooled.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mapped.madvise(mmap.MADV_WILLNEED)
+    return mapped
+
+
+def _open_openpyxl_workbook(file_bytes: UploadBytes) -> openpyxl.Workbook:
+    """Open an OOXML workbook with openpyxl's streaming reader.
+
+    ``read_only`` skips a few package parts; if loading fails for any reason
+    other than a corrupt archive, retry with the full object model.
+    """
+
+    options = {"data_only": True, "keep_links": False}
+    try:
+        return openpyxl.load_workbook(
+            _byte_stream(file_bytes), read_only=True, **options
+        )
+    except (BadZipFile, InvalidFileException):
+        raise
+    except Exception:  # pragma: no cover - defensive
+        return openpyxl.load_workbook(_byte_stream(file_bytes), **options)
+
+
+def _open_workbook(file_bytes: UploadBytes) -> Any:
+    """Open the upload with a streaming reader suited to its format.
+
+    ``.xlsx``/``.xlsm``/``.xlsb`` files are parsed by python-calamine (Rust),
+    falling back to openpyxl in ``read_only`` mode for the odd file calamine
+    rejects. Legacy ``.xls`` files are read with xlrd directly.
+    """
+
+    if not file_bytes:
+        raise HTTPException(status_code=400, detail="Empty upload received")
+
+    try:
+        if file_bytes[: len(_OLE2_SIGNATURE)] == _OLE2_SIGNATURE:
+            # on_demand loads only the sheets actually requested instead of
+            # the whole workbook. xlrd closes any mmap it is handed on
+            # release, so mapped uploads are passed as a bytes copy.
+            return xlrd.open_workbook(file_contents=bytes(file_bytes), on_demand=True)
+        try:
+            return CalamineWorkbook.from_filelike(_byte_stream(file_bytes))
+        except CalamineError:
+            return _open_openpyxl_workbook(file_bytes)
+    except (
+        ValueError, BadZipFile, InvalidFileException, XLRDError, CompDocError
+    ) as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid Excel file: {exc}") from exc
+
+
+def _workbook_sheet_names(workbook: Any) -> List[str]:
+    """Names of the workbook's worksheets; chart and dialog sheets hold no cells."""
+
+    if isinstance(workbook, CalamineWorkbook):
+        return [
+            sheet.name
+            for sheet in workbook.sheets_metadata
+            if sheet.typ == SheetTypeEnum.WorkSheet
+        ]
+    if isinstance(workbook, xlrd.Book):
+        return workbook.sheet_names()
+    return [worksheet.title for worksheet in workbook.worksheets]
+
+
+def _close_workbook(workbook: Any) -> None:
+    if isinstance(workbook, xlrd.Book):
+        workbook.release_resources()
+    else:
+        workbook.close()
+
+
+class _UploadWorkbook:
+    """An upload's workbook, opened on first use and shared by one request.
+
+    calamine and xlrd both hold their own in-memory copy of the file, so a
+    request opens the upload at most once instead of once per sheet thread.
+    The readers are not thread-safe: extraction is serialized here, while
+    cleaning and profiling of the extracted rows still run in parallel. For
+    ``.xls`` uploads this means one xlrd book whose sheets are loaded one
+    after another and unloaded once read.
+    """
+
+    def __init__(self, file_bytes: UploadBytes) -> None:
+        self._file_bytes = file_bytes
+        self._workbook: Any = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "_UploadWorkbook":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _opened(self) -> Any:
+        if self._workbook is None:
+            self._workbook = _open_workbook(self._file_bytes)
+        return self._workbook
+
+    def sheet_names(self) -> List[str]:
+        with self._lock:
+            return _workbook_sheet_names(self._opened())
+
+    def read_rows(
+        self, sheet_name: str, max_rows: int
+    ) -> Tuple[Optional[List[Optional[str]]], List[List[Any]]]:
+        with self._lock:
+            workbook = self._opened()
+            try:
+                return _read_sheet_rows(workbook, sheet_name, max_rows)
+            finally:
+                if isinstance(workbook, xlrd.Book):
+                    # on_demand: drop the parsed sheet before the next is read.
+                    workbook.unload_sheet(sheet_name)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._workbook is not None:
+                _close_workbook(self._workbook)
+                self._workbook = None
+
+
+def _iter_xlrd_rows(sheet: Any, datemode: int) -> Iterable[List[Any]]:
+    """Yield xlrd rows with cells converted the way pandas' xlrd reader does."""
+
+    epoch_day = (1904, 1, 1) if datemode else (1899, 12, 31)
+    for index in range(sheet.nrows):
+        row = sheet.row_values(index)
+        for position, cell_type in enumerate(sheet.row_types(index)):
+            if cell_type == XL_CELL_DATE:
+                try:
+                    value = xldate.xldate_as_datetime(row[position], datemode)
+                except OverflowError:
+                    continue
+                # Excel has no time-only type; dates on the epoch day are times.
+                row[position] = value.time() if value.timetuple()[:3] == epoch_day else value
+            elif cell_type == XL_CELL_ERROR:
+                row[position] = np.nan
+            elif cell_type == XL_CELL_BOOLEAN:
+                row[position] = bool(row[position])
+        yield row
+
+
+def _iter_calamine_rows(sheet: CalamineSheet) -> Iterable[Sequence[Any]]:
+    """Yield calamine rows anchored at column A, like openpyxl and xlrd do.
+
+    ``iter_rows`` starts at the used range's first column, so the blank
+    columns before it are restored to keep header labels and column positions
+    reader-independent. An empty sheet has no range and ``iter_rows`` panics
+    on it.
+    """
+
+    if sheet.height == 0:
+        return
+    first_column = sheet.start[1]
+    if not first_column:
+        yield from sheet.iter_rows()
+        return
+    padding = [None] * first_column
+    for row in sheet.iter_rows():
+        yield padding + row
+
+
+def _iter_sheet_rows(workbook: Any, sheet_name: str) -> Iterable[Sequence[Any]]:
+    if isinstance(workbook, CalamineWorkbook):
+        return _iter_calamine_rows(workbook.get_sheet_by_name(sheet_name))
+
+    if isinstance(workbook, xlrd.Book):
+        return _iter_xlrd_rows(workbook.sheet_by_name(sheet_name), workbook.datemode)
+
+    worksheet = workbook[sheet_name]
+    if isinstance(worksheet, ReadOnlyWorksheet):
+        # Some writers store stale dimensions; without a reset read_only mode
+        # can silently truncate the sheet.
+        worksheet.reset_dimensions()
+    return worksheet.iter_rows(values_only=True)
+
+
+def _cell_to_text(value: Any) -> Any:
+    """Render a raw cell value the way ``read_excel(dtype=str)`` would.
+
+    Empty cells become ``NaN`` so downstream NA handling (pandas, sklearn
+    imputers) keeps working unchanged. Line breaks are normalized to ``\n``
+    like openpyxl's XML parser does; calamine returns them raw.
+    """
+
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        if value in _NA_TOKENS:
+            return np.nan
+        return value.replace("\r\n", "\n").replace("\r", "\n") if "\r" in value else value
+    if isinstance(value, float):
+        if value != value:
+            return np.nan
+        if value.is_integer():
+            return str(int(value))
+    if isinstance(value, date) and not isinstance(value, datetime):
+        # calamine yields plain dates for date-only formats; keep the
+        # datetime rendering openpyxl/xlrd produce.
+        return f"{value.isoformat()} 00:00:00"
+    return str(value)
+
+
+def _read_sheet_rows(
+    workbook: Any, sheet_name: str, max_rows: int
+) -> Tuple[Optional[List[Optional[str]]], List[List[Any]]]:
+    """Read the header plus at most ``max_rows`` data rows of a sheet.
+
+    Rows are consumed straight from the reader's iterator and parsing stops as
+    soon as the cap is reached. As with ``read_excel``, the sheet's first row
+    is the header even when it is blank (its cells become ``Unnamed: N``),
+    and every blank row after it is kept as an empty row (all NaN once
+    padded) that counts towards ``max_rows`` and that
+    ``_clean_sheet_dataframe`` reports as dropped. Trailing empty cells are
+    trimmed.
+    """
+
+    header: Optional[List[Optional[str]]] = None
+    rows: List[List[Any]] = []
+
+    na_tokens = _NA_TOKENS
+    for raw_row in _iter_sheet_rows(workbook, sheet_name):
+        # Plain text is by far the most common cell; keep it off the slow path.
+        row = [
+            value
+            if type(value) is str and value not in na_tokens and "\r" not in value
+            else _cell_to_text(value)
+            for value in raw_row
+        ]
+        # Every non-empty cell is a string at this point.
+        while row and not isinstance(row[-1], str):
+            row.pop()
+        if header is None:
+            header = [value if isinstance(value, str) else None for value in row]
+            continue
+        if len(rows) >= max_rows:
+            break
+        rows.append(row)
+
+    return header, rows
+
+
+def _excel_header(header: List[Optional[str]]) -> List[str]:
+    """Label header cells like ``read_excel``: ``Unnamed: N`` and ``.N`` repeats.
+
+    As in pandas' parser, labelled cells are deduplicated before the blank
+    ones and a ``.N`` suffix that is already another header is skipped.
+    """
+
+    names = [
+        f"Unnamed: {index}" if label is None else label
+        for index, label in enumerate(header)
+    ]
+    order = [index for index, label in enumerate(header) if label is not None]
+    order += [index for index, label in enumerate(header) if label is None]
+    counts: Counter[str] = Counter()
+    for index in order:
+        label = name = names[index]
+        count = counts[name]
+        while count > 0:
+            counts[label] = count + 1
+            name = f"{label}.{count}"
+            count = count + 1 if name in names else counts[name]
+        names[index] = name
+        counts[name] = count + 1
+    return names
+
+
+def _rows_to_frame(
+    header: Optional[List[Optional[str]]], rows: Sequence[List[Any]]
+) -> pd.DataFrame:
+    """Pad trimmed rows to a common width and wrap them in a DataFrame."""
+
+    if header is None:
+        return pd.DataFrame()
+
+    width = max([len(header), *(len(row) for row in rows)])
+    columns = _excel_header(header + [None] * (width - len(header)))
+    padded = [row + [np.nan] * (width - len(row)) for row in rows]
+
+    return pd.DataFrame(padded, columns=columns, dtype=object)
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping shared by the sheet parsing threads.
+
+    Besides the entry count, an optional ``max_weight`` bounds the summed
+    ``weigh(value)`` of the cached values (e.g. estimated bytes) so a few huge
+    sheets cannot pin an unbounded amount of memory. With ``ttl`` set, entries
+    also expire that many seconds after they were stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        max_weight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self._maxsize = maxsize
+        self._max_weight = max_weight
+        self._weigh = weigh or (lambda _value: 0)
+        self._ttl = ttl
+        self._entries: OrderedDict[Any, Tuple[Any, int, float]] = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[key]
+                self._weight -= entry[1]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Any, value: Any) -> None:
+        weight = self._weigh(value)
+        expires = time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._weight -= previous[1]
+            self._entries[key] = (value, weight, expires)
+            self._weight += weight
+            while len(self._entries) > 1 and (
+                len(self._entries) > self._maxsize
+                or (self._max_weight is not None and self._weight > self._max_weight)
+            ):
+                _, (_, evicted_weight, _) = self._entries.popitem(last=False)
+                self._weight -= evicted_weight
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``; return how many."""
+
+        with self._lock:
+            matching = [key for key in self._entries if predicate(key)]
+            for key in matching:
+                _, weight, _ = self._entries.pop(key)
+                self._weight -= weight
+            return len(matching)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+
+SHEET_CACHE_SIZE = 32
+# Per cache and per worker process. Override with SHEET_CACHE_MAX_BYTES.
+SHEET_CACHE_MAX_BYTES = int(os.environ.get("SHEET_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+SHEET_CACHE_TTL_SECONDS = 300
+# Approximate memory retained per cached cell (the str plus its list or dict
+# slot); entries are weighed by cell count times this estimate.
+_CACHED_CELL_BYTES = 150
+
+
+def _cached_rows_bytes(entry: Tuple[int, Any, List[List[Any]]]) -> int:
+    _, header, rows = entry
+    return (len(header or ()) + sum(len(row) for row in rows)) * _CACHED_CELL_BYTES
+
+
+def _payload_bytes(payload: Dict[str, Any]) -> int:
+    return len(payload["columns"]) * payload["sample_row_count"] * _CACHED_CELL_BYTES
+
+
+# Raw rows per (upload digest, sheet) so /preview, /normalize and /ml/pipeline
+# calls on the same file skip re-extracting the workbook. A read taken with a
+# larger row cap also serves every smaller one (see _read_sheet_frame).
+_sheet_rows_cache = _LRUCache(
+    SHEET_CACHE_SIZE,
+    max_weight=SHEET_CACHE_MAX_BYTES,
+    weigh=_cached_rows_bytes,
+    ttl=SHEET_CACHE_TTL_SECONDS,
+)
+_sheet_names_cache = _LRUCache(SHEET_CACHE_SIZE, ttl=SHEET_CACHE_TTL_SECONDS)
+# Finished sheet payloads, so repeating an identical request is a lookup.
+_sheet_payload_cache = _LRUCache(
+    SHEET_CACHE_SIZE,
+    max_weight=SHEET_CACHE_MAX_BYTES,
+    weigh=_payload_bytes,
+    ttl=SHEET_CACHE_TTL_SECONDS,
+)
+
+
+def _upload_digest(file_bytes: UploadBytes) -> bytes:
+    return xxhash.xxh3_128_digest(file_bytes)
+
+
+def _cached_sheet_names(workbook: _UploadWorkbook, digest: bytes) -> List[str]:
+    names = _sheet_names_cache.get(digest)
+    if names is None:
+        names = workbook.sheet_names()
+        _sheet_names_cache.put(digest, names)
+    return list(names)
+
+
+# Opt-in on-disk cache of fully read sheets, shared by every worker process
+# and surviving restarts. Disabled unless PARQUET_CACHE_DIR is set.
+PARQUET_CACHE_DIR = os.environ.get("PARQUET_CACHE_DIR") or None
+if PARQUET_CACHE_DIR:
+    # Only the disk cache and /arrow use pyarrow; skip the import otherwise.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+_DIGEST_HEX = re.compile(r"[0-9a-f]{32}")
+
+
+def _parquet_path(digest: bytes, sheet_name: str) -> str:
+    return os.path.join(
+        PARQUET_CACHE_DIR, digest.hex(), f"{quote(sheet_name, safe='')}.parquet"
+    )
+
+
+def _store_sheet_parquet(
+    digest: bytes, sheet_name: str, header: List[Optional[str]], rows: List[List[Any]]
+) -> None:
+    """Persist a fully read sheet; columns are positional, the header is metadata."""
+
+    frame = _rows_to_frame(header, rows)
+    table = pa.Table.from_arrays(
+        [
+            pa.array(frame.iloc[:, index].to_numpy(), type=pa.string(), from_pandas=True)
+            for index in range(frame.shape[1])
+        ],
+        names=[str(index) for index in range(frame.shape[1])],
+        metadata={"header": orjson.dumps(header)},
+    )
+    path = _parquet_path(digest, sheet_name)
+    partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(table, partial, compression="zstd")
+        os.replace(partial, path)
+    except OSError:
+        # The cache is best effort; the in-memory copy still serves this process.
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+def _load_sheet_parquet(
+    digest: bytes, sheet_name: str
+) -> Optional[Tuple[List[Optional[str]], List[List[Any]]]]:
+    """Return ``(header, rows)`` for a persisted sheet, trimmed like a fresh read."""
+
+    path = _parquet_path(digest, sheet_name)
+    if not os.path.exists(path):
+        return None
+
+    table = pq.read_table(path)
+    header = orjson.loads(table.schema.metadata[b"header"])
+    rows: List[List[Any]] = []
+    for values in zip(*(column.to_pylist() for column in table.columns)):
+        row = [np.nan if value is None else value for value in values]
+        while row and not isinstance(row[-1], str):
+            row.pop()
+        rows.append(row)
+    return header, rows
+
+
+def _cache_headers(digest: bytes) -> Dict[str, str]:
+    """Expose the upload digest so clients can address its cached sheets."""
+
+    return {"X-Upload-Digest": digest.hex()}
+
+
+def _invalidate_upload(digest: bytes) -> int:
+    """Forget every cached read of an upload, in memory and on disk."""
+
+    evicted = _sheet_names_cache.discard_where(lambda key: key == digest)
+    for cache in (_sheet_rows_cache, _sheet_payload_cache):
+        evicted += cache.discard_where(lambda key: key[0] == digest)
+    if PARQUET_CACHE_DIR:
+        shutil.rmtree(os.path.join(PARQUET_CACHE_DIR, digest.hex()), ignore_errors=True)
+    return evicted
+
+
+def _read_sheet_frame(
+    workbook: _UploadWorkbook, digest: bytes, sheet_name: str, max_rows: int
+) -> pd.DataFrame:
+    """Return the raw frame for ``sheet_name`` capped at ``max_rows`` rows.
+
+    A cached read is reused whenever it covers the request, either because it
+    was taken with a higher cap or because it already holds the whole sheet.
+    Rows are stored unpadded so slicing yields exactly what a fresh read with
+    the smaller cap would. With ``PARQUET_CACHE_DIR`` set, whole sheets are
+    also persisted to disk and reloaded from there instead of the workbook.
+    """
+
+    key = (digest, sheet_name)
+    cached = _sheet_rows_cache.get(key)
+    if cached is not None:
+        cap, header, rows = cached
+        if cap >= max_rows or len(rows) < cap:
+            return _rows_to_frame(header, rows[:max_rows])
+
+    if PARQUET_CACHE_DIR:
+        stored = _load_sheet_parquet(digest, sheet_name)
+        if stored is not None:
+            header, rows = stored
+            # Only whole sheets are persisted, so any cap is covered.
+            _sheet_rows_cache.put(key, (len(rows) + 1, header, rows))
+            return _rows_to_frame(header, rows[:max_rows])
+
+    header, rows = workbook.read_rows(sheet_name, max_rows)
+    _sheet_rows_cache.put(key, (max_rows, header, rows))
+    if PARQUET_CACHE_DIR and header is not None and len(rows) < max_rows:
+        _store_sheet_parquet(digest, sheet_name, header, rows)
+
+    return _rows_to_frame(header, rows)
+
+
+def _ensure_sheets_exist(
+    available_sheets: Sequence[str], sheet_names: Optional[List[str]]
+) -> None:
+    if not sheet_names:
+        return
+
+    requested: Set[str] = set(sheet_names)
+    available: Set[str] = set(available_sheets)
+    missing = requested - available
+    if missing:
+        missing_list = ", ".join(sorted(missing))
+        raise HTTPException(
+            status_code=404,
+            detail=f"Sheet(s) not found: {missing_list}",
+        )
+
+
+def _target_sheet_names(
+    workbook: _UploadWorkbook, digest: bytes, sheet_names: Optional[List[str]]
+) -> List[str]:
+    """Validate the requested sheets and return them in workbook order."""
+
+    available = _cached_sheet_names(workbook, digest)
+    _ensure_sheets_exist(available, sheet_names)
+    if not sheet_names:
+        return available
+
+    requested: Set[str] = set(sheet_names)
+    return [name for name in available if name in requested]
+
+
+SHEET_PARSE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Shared by every request; threads (not processes) so the sheets of one upload
+# share its workbook instead of each process parsing its own copy.
+_sheet_executor = ThreadPoolExecutor(
+    max_workers=SHEET_PARSE_WORKERS, thread_name_prefix="sheet-parser"
+)
+
+
+def _map_sheets(
+    parse_sheet: Callable[[_UploadWorkbook, str], Any],
+    workbook: _UploadWorkbook,
+    target_sheets: Sequence[str],
+) -> List[Any]:
+    """Apply ``parse_sheet`` to every sheet, in parallel when there are several.
+
+    All tasks share the request's workbook, which serializes the reads (or
+    is skipped for cached rows). Results keep the original sheet order.
+    """
+
+    if len(target_sheets) <= 1:
+        return [parse_sheet(workbook, name) for name in target_sheets]
+
+    return list(
+        _sheet_executor.map(lambda name: parse_sheet(workbook, name), target_sheets)
+    )
+
+
+def _filled_values(frame: pd.DataFrame) -> np.ndarray:
+    """Copy of the frame's cells as one object array, with missing cells as ``""``.
+
+    Masking the 2-D array once replaces ``fillna("")``, which goes through
+    pandas' per-column machinery and allocates a whole new DataFrame.
+    """
+
+    values = frame.to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = ""
+    return values
+
+
+def _frame_to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Row dicts for an all-object frame, without ``to_dict``'s per-cell boxing.
+
+    Missing cells become ``""``. Column names are interned so every record,
+    and every cached payload for the same headers, shares one key object per
+    column.
+    """
+
+    columns = tuple(sys.intern(column) for column in frame.columns)
+    return [dict(zip(columns, row)) for row in _filled_values(frame).tolist()]
+
+
+def _frame_to_columns(frame: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Column-oriented ``{column: [values]}`` mapping with missing cells as ``""``."""
+
+    values = _filled_values(frame)
+    return {
+        sys.intern(column): values[:, index].tolist()
+        for index, column in enumerate(frame.columns)
+    }
+
+
+def _parse_one_sheet(
+    workbook: _UploadWorkbook,
+    sheet_name: str,
+    *,
+    digest: bytes,
+    sample_rows: int,
+    max_rows_per_sheet: int,
+    orient: str = "records",
+) -> Dict[str, Any]:
+    """Build the preview payload for a single sheet.
+
+    ``orient`` mirrors ``DataFrame.to_dict``: ``"records"`` yields one dict
+    per row, ``"list"`` a column-oriented ``{column: [values]}`` mapping.
+    Payloads are cached per upload and treated as read-only by callers.
+    """
+
+    cache_key = (digest, sheet_name, sample_rows, max_rows_per_sheet, orient)
+    cached = _sheet_payload_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    frame = _read_sheet_frame(
+        workbook, digest, sheet_name, max_rows_per_sheet + 1
+    )
+
+    cleaned, cleanup_report = _clean_sheet_dataframe(frame)
+    columns: List[str] = [sys.intern(column) for column in cleaned.columns]
+    full_row_count = len(cleaned)
+    truncated = full_row_count > max_rows_per_sheet
+
+    # Only the rows actually returned are turned into Python objects.
+    keep = min(sample_rows, max_rows_per_sheet)
+    returned = cleaned.head(keep)
+    if orient == "records":
+        preview_rows: Any = _frame_to_records(returned)
+    else:
+        preview_rows = _frame_to_columns(returned)
+    sample_row_count = len(returned)
+    total_rows = full_row_count
+
+    payload = {
+        "sheet": sheet_name,
+        "columns": columns,
+        "sample_row_count": sample_row_count,
+        "preview_rows": preview_rows,
+        "total_rows": total_rows,
+        "truncated": truncated,
+        "dropped_rows": cleanup_report["dropped_rows"],
+        "dropped_columns": cleanup_report["dropped_columns"],
+        "column_coverage": cleanup_report["column_coverage"],
+        "pattern_signals": cleanup_report["pattern_signals"],
+        "pattern_sample_rows": cleanup_report["pattern_sample_rows"],
+    }
+    _sheet_payload_cache.put(cache_key, payload)
+    return payload
+
+
 def _load_excel(
-    file_bytes: bytes,
+    file_bytes: UploadBytes,
     sample_rows: int = 50,
     *,
     max_rows_per_sheet: int = 50_000,
     sheet_names: Optional[List[str]] = None,
+    orient: str = "records",
+    digest: Optional[bytes] = None,
 ) -> List[Dict[str, Any]]:
     """Load the Excel workbook and extract lightweight previews per sheet.
 
     The parser keeps memory usage bounded by capping the number of scanned rows.
     A truncated flag indicates when a sheet exceeded the configured ceiling so
-    callers can react accordingly.
+    callers can react accordingly. Sheets are parsed concurrently. Callers that
+    already hashed the upload pass its ``digest`` to skip hashing it again.
     """
 
-    if not file_bytes:
-        raise HTTPException(status_code=400, detail="Empty upload received")
-
-    try:
-        workbook = pd.ExcelFile(BytesIO(file_bytes))
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=f"Invalid Excel file: {exc}") from exc
-
-    sheets: List[Dict[str, Any]] = []
-
-    if sheet_names:
-        requested: Set[str] = set(sheet_names)
-        available: Set[str] = set(workbook.sheet_names)
-        missing = requested - available
-        if missing:
-            missing_list = ", ".join(sorted(missing))
-            raise HTTPException(
-                status_code=404,
-                detail=f"Sheet(s) not found: {missing_list}",
-            )
-
-    for sheet_name in workbook.sheet_names:
-        if sheet_names and sheet_name not in sheet_names:
-            continue
-        truncated = False
-        frame = pd.read_excel(
+    if digest is None:
+        digest = _upload_digest(file_bytes)
+    with _UploadWorkbook(file_bytes) as workbook:
+        target_sheets = _target_sheet_names(workbook, digest, sheet_names)
+        return _map_sheets(
+            lambda book, name: _parse_one_sheet(
+                book,
+                name,
+                digest=digest,
+                sample_rows=sample_rows,
+                max_rows_per_sheet=max_rows_per_sheet,
+                orient=orient,
+            ),
             workbook,
-            sheet_name=sheet_name,
-            dtype=str,
-            nrows=max_rows_per_sheet + 1,
-            engine=workbook.engine,
+            target_sheets,
         )
 
-        cleaned, cleanup_report = _clean_sheet_dataframe(frame)
-        columns: List[str] = list(cleaned.columns)
-        filled = cleaned.fillna("")
-        records = filled.to_dict(orient="records")
-        full_row_count = len(records)
-
-        if full_row_count > max_rows_per_sheet:
-            truncated = True
-            records = records[:max_rows_per_sheet]
-
-        if not columns:
-            empty_frame = workbook.parse(sheet_name, nrows=0, dtype=str)
-            columns = list(empty_frame.columns)
-
-        preview_rows = records[:sample_rows]
-        sample_row_count = len(preview_rows)
-        total_rows = full_row_count
-
-        sheets.append(
-            {
-                "sheet": sheet_name,
-                "columns": columns,
-                "sample_row_count": sample_row_count,
-                "preview_rows": preview_rows,
-                "total_rows": total_rows,
-                "truncated": truncated,
-                "dropped_rows": cleanup_report["dropped_rows"],
-                "dropped_columns": cleanup_report["dropped_columns"],
-                "column_coverage": cleanup_report["column_coverage"],
-                "pattern_signals": cleanup_report["pattern_signals"],
-            }
-        )
 
-    return sheets
+def _load_one_frame(
+    workbook: _UploadWorkbook,
+    sheet_name: str,
+    *,
+    digest: bytes,
+    max_rows_per_sheet: int,
+) -> pd.DataFrame:
+    """Read and clean a single sheet for the ML pipeline."""
+
+    frame = _read_sheet_frame(workbook, digest, sheet_name, max_rows_per_sheet)
+    cleaned, _ = _clean_sheet_dataframe(frame)
+    return cleaned
 
 
 def _load_sheet_frames(
-    file_bytes: bytes,
+    file_bytes: UploadBytes,
     *,
     max_rows_per_sheet: int = 5_000,
     sheet_names: Optional[List[str]] = None,
 ) -> Dict[str, pd.DataFrame]:
     """Load worksheets into pandas DataFrames for ML processing."""
 
-    if not file_bytes:
-        raise HTTPException(status_code=400, detail="Empty upload received")
-
-    try:
-        workbook = pd.ExcelFile(BytesIO(file_bytes))
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=f"Invalid Excel file: {exc}") from exc
-
-    if sheet_names:
-        requested: Set[str] = set(sheet_names)
-        available: Set[str] = set(workbook.sheet_names)
-        missing = requested - available
-        if missing:
-            missing_list = ", ".join(sorted(missing))
-            raise HTTPException(
-                status_code=404,
-                detail=f"Sheet(s) not found: {missing_list}",
-            )
-
-    frames: Dict[str, pd.DataFrame] = {}
-    for sheet_name in workbook.sheet_names:
-        if sheet_names and sheet_name not in sheet_names:
-            continue
-        frame = pd.read_excel(
+    digest = _upload_digest(file_bytes)
+    with _UploadWorkbook(file_bytes) as workbook:
+        target_sheets = _target_sheet_names(workbook, digest, sheet_names)
+        cleaned_frames = _map_sheets(
+            lambda book, name: _load_one_frame(
+                book, name, digest=digest, max_rows_per_sheet=max_rows_per_sheet
+            ),
             workbook,
-            sheet_name=sheet_name,
-            dtype=str,
-            nrows=max_rows_per_sheet,
-            engine=workbook.engine,
+            target_sheets,
         )
-        cleaned, _ = _clean_sheet_dataframe(frame)
-        frames[sheet_name] = cleaned
+    frames: Dict[str, pd.DataFrame] = dict(zip(target_sheets, cleaned_frames))
 
     if not frames:
         raise HTTPException(status_code=404, detail="No sheets found in workbook")
@@ -254,11 +1156,13 @@ def _load_sheet_frames(
 
 
 async def _load_excel_async(
-    file_bytes: bytes,
+    file_bytes: UploadBytes,
     *,
     sample_rows: int = 50,
     max_rows_per_sheet: int = 50_000,
     sheet_names: Optional[List[str]] = None,
+    orient: str = "records",
+    digest: Optional[bytes] = None,
 ) -> List[Dict[str, Any]]:
     """Run the CPU-bound Excel parsing in a thread executor."""
 
@@ -270,50 +1174,87 @@ async def _load_excel_async(
             sample_rows=sample_rows,
             max_rows_per_sheet=max_rows_per_sheet,
             sheet_names=sheet_names,
+            orient=orient,
+            digest=digest,
         ),
     )
 
 
 class ExcelProcessingQueue:
-    """Tiny FIFO queue to serialize Excel parsing tasks.
+    """Bounded-concurrency gate for Excel parsing tasks.
 
-    This keeps concurrent uploads from overwhelming the server while still
-    keeping the FastAPI handlers async-friendly.
+    Up to ``max_concurrent`` uploads are parsed at once; the rest wait their
+    turn. This keeps concurrent uploads from overwhelming the server while
+    still keeping the FastAPI handlers async-friendly.
     """
 
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[
-            tuple[Callable[[], Awaitable[Any]], asyncio.Future[Any]]
-        ] = asyncio.Queue()
-        self._worker_started = False
-
-    async def _ensure_worker(self) -> None:
-        if self._worker_started:
-            return
-        self._worker_started = True
-        asyncio.create_task(self._worker())
-
-    async def _worker(self) -> None:
-        while True:
-            coro_factory, future = await self._queue.get()
-            try:
-                result = await coro_factory()
-            except Exception as exc:  # pragma: no cover - defensive
-                future.set_exception(exc)
-            else:
-                future.set_result(result)
-            finally:
-                self._queue.task_done()
+    def __init__(self, max_concurrent: int) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrent)
 
     async def enqueue(self, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
-        await self._ensure_worker()
-        loop = asyncio.get_running_loop()
-        future: asyncio.Future[Any] = loop.create_future()
-        await self._queue.put((coro_factory, future))
-        return await future
+        async with self.slot():
+            return await coro_factory()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a parsing slot for work that cannot be wrapped in one awaitable."""
+
+        async with self._semaphore:
+            yield
 
 
-processing_queue = ExcelProcessingQueue()
+MAX_CONCURRENT_PARSES = max(1, os.cpu_count() or 1)
+
+processing_queue = ExcelProcessingQueue(MAX_CONCURRENT_PARSES)
+
+NORMALIZE_MAX_ROWS = 10_000
+NDJSON_BATCH_ROWS = 500
+
+
+async def _normalize_ndjson(
+    workbook: _UploadWorkbook, digest: bytes, target_sheets: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """Yield /normalize output as NDJSON, one sheet at a time.
+
+    Each sheet starts with a metadata line (``columns``, ``total_rows``,
+    ``truncated``) followed by one ``{"sheet", "row"}`` line per row. Only the
+    sheet being emitted is held in memory and lines are flushed in batches.
+    ``workbook`` is closed once the stream ends.
+    """
+
+    loop = asyncio.get_running_loop()
+    with workbook:
+        for sheet_name in target_sheets:
+            # The slot only covers parsing; it is released before the sheet is
+            # written out so a slow client does not block other uploads.
+            async with processing_queue.slot():
+                payload = await loop.run_in_executor(
+                    None,
+                    lambda: _parse_one_sheet(
+                        workbook,
+                        sheet_name,
+                        digest=digest,
+                        sample_rows=NORMALIZE_MAX_ROWS,
+                        max_rows_per_sheet=NORMALIZE_MAX_ROWS,
+                    ),
+                )
+            yield orjson.dumps(
+                {
+                    "sheet": sheet_name,
+                    "columns": payload["columns"],
+                    "total_rows": payload["total_rows"],
+                    "truncated": payload["truncated"],
+                }
+            ) + b"\n"
+
+            batch: List[bytes] = []
+            for row in payload["preview_rows"]:
+                batch.append(orjson.dumps({"sheet": sheet_name, "row": row}))
+                if len(batch) >= NDJSON_BATCH_ROWS:
+                    yield b"\n".join(batch) + b"\n"
+                    batch = []
+            if batch:
+                yield b"\n".join(batch) + b"\n"
 
 
 def _build_navigation(
@@ -357,6 +1298,7 @@ class SheetPreview(BaseModel):
     dropped_columns: int
     column_coverage: Dict[str, float]
     pattern_signals: Dict[str, Dict[str, float]]
+    pattern_sample_rows: int
 
 
 class SheetCursor(BaseModel):
@@ -410,23 +1352,30 @@ async def preview_excel(
             "returned."
         ),
     ),
-) -> PreviewResponse:
+) -> Response:
     """Parse an uploaded Excel file and return normalized sheet previews."""
 
-    file_bytes = await file.read()
+    file_bytes = await _read_upload(file)
+    digest = _upload_digest(file_bytes)
     sheet_filter = [sheet] if sheet else None
     sheets: List[Dict[str, Any]] = await processing_queue.enqueue(
-        lambda: _load_excel_async(file_bytes, sheet_names=sheet_filter)
+        lambda: _load_excel_async(file_bytes, sheet_names=sheet_filter, digest=digest)
     )
 
     total_rows_estimate = sum(sheet_item["total_rows"] for sheet_item in sheets)
+    navigation = _build_navigation(sheets, requested_sheet=sheet)
 
-    return PreviewResponse(
-        filename=file.filename,
-        sheets=[SheetPreview(**sheet_item) for sheet_item in sheets],
-        total_sheets=len(sheets),
-        total_rows_estimate=total_rows_estimate,
-        navigation=_build_navigation(sheets, requested_sheet=sheet),
+    # Sheet dicts are built by _load_excel and already match SheetPreview;
+    # returning a response object skips re-validating every preview row.
+    return ORJSONResponse(
+        {
+            "filename": file.filename,
+            "sheets": sheets,
+            "total_sheets": len(sheets),
+            "total_rows_estimate": total_rows_estimate,
+            "navigation": navigation.model_dump() if navigation else None,
+        },
+        headers=_cache_headers(digest),
     )
 
 
@@ -440,23 +1389,62 @@ async def normalize_excel(
             "in the workbook."
         ),
     ),
-) -> Dict[str, Any]:
+    layout: Literal["rows", "columns"] = Query(
+        "rows",
+        description=(
+            "Shape of each sheet's data: a list of row objects (default) or a "
+            "column-oriented mapping of column name to values."
+        ),
+    ),
+    stream: bool = Query(
+        False,
+        description=(
+            "Stream the rows as NDJSON (application/x-ndjson), one sheet at a "
+            "time, instead of buffering a single JSON document. Row layout only."
+        ),
+    ),
+) -> Response:
     """
     Normalize an uploaded Excel file to row-wise JSON for downstream use.
 
     The endpoint keeps data as strings to avoid pandas type coercion and
     returns a compact payload that the Node.js orchestrator can persist or
-    batch-send to MongoDB.
+    batch-send to MongoDB. ``layout=columns`` avoids repeating every column
+    name once per row; ``stream=true`` emits NDJSON lines instead.
     """
 
-    file_bytes = await file.read()
+    if stream and layout == "columns":
+        raise HTTPException(
+            status_code=400, detail="stream=true cannot be combined with layout=columns"
+        )
+
+    file_bytes = await _read_upload(file)
+    digest = _upload_digest(file_bytes)
     sheet_filter = [sheet] if sheet else None
+    if stream:
+        # Validate before the response starts so errors keep their status code.
+        workbook = _UploadWorkbook(file_bytes)
+        try:
+            target_sheets = await asyncio.get_running_loop().run_in_executor(
+                None, _target_sheet_names, workbook, digest, sheet_filter
+            )
+        except BaseException:
+            workbook.close()
+            raise
+        return StreamingResponse(
+            _normalize_ndjson(workbook, digest, target_sheets),
+            media_type="application/x-ndjson",
+            headers=_cache_headers(digest),
+        )
+
     sheets: List[Dict[str, Any]] = await processing_queue.enqueue(
         lambda: _load_excel_async(
             file_bytes,
-            sample_rows=10_000,
-            max_rows_per_sheet=10_000,
+            sample_rows=NORMALIZE_MAX_ROWS,
+            max_rows_per_sheet=NORMALIZE_MAX_ROWS,
             sheet_names=sheet_filter,
+            orient="list" if layout == "columns" else "records",
+            digest=digest,
         )
     )
 
@@ -473,12 +1461,17 @@ async def normalize_excel(
         for sheet in sheets
     }
 
-    return {
-        "filename": file.filename,
-        "sheets": normalized,
-        "metadata": metadata,
-        "navigation": navigation.dict() if navigation else None,
-    }
+    # Returned as a response object so FastAPI skips response-model processing
+    # of the (potentially 10k-row) payload and hands it straight to orjson.
+    return ORJSONResponse(
+        {
+            "filename": file.filename,
+            "sheets": normalized,
+            "metadata": metadata,
+            "navigation": navigation.model_dump() if navigation else None,
+        },
+        headers=_cache_headers(digest),
+    )
 
 
 @app.post("/ml/pipeline", response_model=MLPipelineResponse)
@@ -503,11 +1496,16 @@ async def ml_pipeline_preview(
 ) -> MLPipelineResponse:
     """Return ML-friendly profiling for uploaded Excel sheets."""
 
-    file_bytes = await file.read()
+    file_bytes = await _read_upload(file)
     sheet_filter = [sheet] if sheet else None
-    frames = _load_sheet_frames(
-        file_bytes, max_rows_per_sheet=sample_rows, sheet_names=sheet_filter
-    )
+    loop = asyncio.get_running_loop()
+    async with processing_queue.slot():
+        frames = await loop.run_in_executor(
+            None,
+            lambda: _load_sheet_frames(
+                file_bytes, max_rows_per_sheet=sample_rows, sheet_names=sheet_filter
+            ),
+        )
 
     summaries: List[SheetMLPreview] = []
     for sheet_name, frame in frames.items():
@@ -532,3 +1530,74 @@ async def ml_pipeline_preview(
         )
 
     return MLPipelineResponse(filename=file.filename, sheets=summaries)
+
+
+def _sheet_arrow_stream(digest: bytes, sheet_name: str) -> Optional[bytes]:
+    """Clean a persisted sheet and serialize it as an Arrow IPC stream."""
+
+    stored = _load_sheet_parquet(digest, sheet_name)
+    if stored is None:
+        return None
+
+    cleaned, _ = _clean_sheet_dataframe(_rows_to_frame(*stored))
+    table = pa.Table.from_arrays(
+        [
+            pa.array(cleaned[column].to_numpy(), type=pa.string(), from_pandas=True)
+            for column in cleaned.columns
+        ],
+        names=list(cleaned.columns),
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+@app.post("/cache/invalidate/{digest}")
+async def invalidate_cache(digest: str) -> Dict[str, int]:
+    """
+    Drop this process's cached reads of an upload once the orchestrator is done.
+
+    ``digest`` is the ``X-Upload-Digest`` response header. The in-memory
+    caches are per process: other worker processes keep their entries until
+    ``SHEET_CACHE_TTL_SECONDS`` expires them. Parquet files are shared and
+    removed for all of them.
+    """
+
+    if not _DIGEST_HEX.fullmatch(digest):
+        raise HTTPException(status_code=400, detail="Invalid upload digest")
+    return {"evicted": _invalidate_upload(bytes.fromhex(digest))}
+
+
+@app.get("/arrow/{digest}/{sheet:path}")
+async def sheet_arrow(digest: str, sheet: str) -> Response:
+    """
+    Return a previously parsed sheet, cleaned, as an Arrow IPC stream.
+
+    ``digest`` is the ``X-Upload-Digest`` header sent by /preview and
+    /normalize. Requires ``PARQUET_CACHE_DIR``; only sheets that were read in
+    full are persisted and anything else is a 404.
+    """
+
+    if not PARQUET_CACHE_DIR or not _DIGEST_HEX.fullmatch(digest):
+        raise HTTPException(status_code=404, detail="Sheet not cached")
+
+    payload = await asyncio.get_running_loop().run_in_executor(
+        None, _sheet_arrow_stream, bytes.fromhex(digest), sheet
+    )
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Sheet not cached")
+    return Response(payload, media_type="application/vnd.apache.arrow.stream")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
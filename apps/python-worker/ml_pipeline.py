@@ -6,11 +6,14 @@ produce a reproducible feature matrix that downstream models can consume.
 """
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+import polars as pl
+from pandas.tseries.api import guess_datetime_format
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
@@ -28,43 +31,122 @@ class MLPreview:
     pipeline_steps: List[str]
 
 
+_BOOLEAN_LABELS = {
+    "true": "true",
+    "1": "true",
+    "yes": "true",
+    "si": "true",
+    "sí": "true",
+    "false": "false",
+    "0": "false",
+    "no": "false",
+}
+# Dates such as 2024-01-02 or 02/01/2024, and times of day such as 12:30.
+_DATE_SHAPE = re.compile(r"^(?:\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}|\d{1,2}:\d{2})")
+_EPOCH = pd.Timestamp("1970-01-01")
+
+
+def _parse_dates(as_text: pd.Series) -> pd.Series:
+    """Parse a text column as datetimes, guessing the format only once.
+
+    Values with a UTC offset are converted to naive UTC so they can be mixed
+    with naive values and subtracted from ``_EPOCH``.
+    """
+
+    present = as_text[~as_text.isin(["nan", ""])]
+    fmt = guess_datetime_format(present.iloc[0]) if len(present) else None
+    if fmt is not None:
+        return pd.to_datetime(
+            as_text, format=fmt, errors="coerce", utc=True
+        ).dt.tz_convert(None)
+
+    # Without a guessable format only date-shaped values reach the slow,
+    # per-element parser; everything else is NaT.
+    parsed = pd.Series(pd.NaT, index=as_text.index, dtype="datetime64[ns]")
+    candidates = as_text[as_text.str.match(_DATE_SHAPE)]
+    if not candidates.empty:
+        parsed[candidates.index] = pd.to_datetime(
+            candidates, errors="coerce", utc=True
+        ).dt.tz_convert(None)
+    return parsed
+
+
+def _to_polars_text(frame: pd.DataFrame) -> pl.DataFrame:
+    """Convert *frame* to a polars frame of raw text keyed by column position.
+
+    Missing cells become nulls. Columns are built from plain lists so object
+    columns do not need pyarrow for the conversion.
+    """
+
+    return pl.DataFrame(
+        [
+            pl.Series(
+                str(index),
+                frame.iloc[:, index].to_numpy(dtype=object, na_value=None).tolist(),
+                dtype=pl.String,
+                strict=False,
+            )
+            for index in range(frame.shape[1])
+        ]
+    )
+
+
 def _split_column_types(frame: pd.DataFrame) -> Tuple[pd.DataFrame, List[str], List[str]]:
-    """Infer numeric vs categorical columns using enriched heuristics."""
+    """Infer numeric vs categorical columns using enriched heuristics.
+
+    Numeric, boolean and uniqueness shares are computed for all columns with
+    polars expressions; dates are only parsed for columns that are not
+    already mostly numeric, since those can never be classified as date-like.
+    """
 
     numeric_columns: List[str] = []
     categorical_columns: List[str] = []
-    coerced = frame.copy()
-
-    for column in frame.columns:
-        raw_series = frame[column]
-        as_text = raw_series.astype(str).str.strip()
-        numeric_series = pd.to_numeric(as_text, errors="coerce")
-        numeric_share = float(numeric_series.notna().mean()) if len(numeric_series) else 0.0
-        unique_values = raw_series.nunique(dropna=True)
-        date_parsed = pd.to_datetime(as_text, errors="coerce")
-        date_share = float(date_parsed.notna().mean()) if len(date_parsed) else 0.0
-        boolean_share = float(
-            as_text.str.lower().isin({"true", "false", "0", "1", "yes", "no", "si", "sí"}).mean()
-        )
-
-        is_date_like = date_share > 0.55 and numeric_share < 0.5
-        is_numeric_like = numeric_share > 0.55 or (numeric_share > 0.35 and unique_values > 3)
-        is_boolean_like = boolean_share > 0.65
+    if frame.empty:
+        return frame.copy(), numeric_columns, categorical_columns
 
-        if is_date_like:
-            coerced[column] = date_parsed.map(lambda value: value.timestamp() if pd.notna(value) else np.nan)
-            numeric_columns.append(column)
-        elif is_numeric_like:
-            coerced[column] = numeric_series
+    text = _to_polars_text(frame)
+    stripped = [pl.col(name).str.strip_chars() for name in text.columns]
+    # "nan" casts to NaN, which pandas never counted as a parsed number.
+    numeric = text.select(
+        expr.cast(pl.Float64, strict=False).fill_nan(None) for expr in stripped
+    )
+    numeric_share = numeric.select(pl.all().is_not_null().mean()).row(0, named=True)
+    shares = text.select(
+        *(
+            expr.str.to_lowercase()
+            .is_in(list(_BOOLEAN_LABELS))
+            .fill_null(False)
+            .mean()
+            .alias(f"{name}:boolean")
+            for name, expr in zip(text.columns, stripped)
+        ),
+        *(pl.col(name).drop_nulls().n_unique().alias(f"{name}:unique") for name in text.columns),
+    ).row(0, named=True)
+
+    updates: Dict[str, pd.Series] = {}
+    for index, column in enumerate(frame.columns):
+        share = numeric_share[str(index)]
+        unique_count = shares[f"{index}:unique"]
+        if share < 0.5:
+            dates = _parse_dates(frame[column].astype(str).str.strip())
+            if dates.notna().mean() > 0.55:
+                updates[column] = (dates - _EPOCH) / pd.Timedelta(seconds=1)
+                numeric_columns.append(column)
+                continue
+
+        if share > 0.55 or (share > 0.35 and unique_count > 3):
+            updates[column] = pd.Series(
+                numeric[str(index)].to_numpy(), index=frame.index, name=column
+            )
             numeric_columns.append(column)
         else:
-            if is_boolean_like:
-                coerced[column] = as_text.str.lower().replace(
-                    {"true": "true", "1": "true", "yes": "true", "si": "true", "sí": "true",
-                     "false": "false", "0": "false", "no": "false"}
+            if shares[f"{index}:boolean"] > 0.65:
+                updates[column] = (
+                    frame[column].astype(str).str.strip().str.lower().replace(_BOOLEAN_LABELS)
                 )
             categorical_columns.append(column)
 
+    coerced = frame.assign(**updates) if updates else frame.copy()
     return coerced, numeric_columns, categorical_columns
 
 
@@ -75,35 +157,73 @@ def _missingness_by_column(frame: pd.DataFrame) -> Dict[str, float]:
 def _iqr_cap(
     frame: pd.DataFrame, numeric_columns: List[str]
 ) -> Tuple[pd.DataFrame, Dict[str, Dict[str, float]]]:
-    """Cap numeric outliers using the IQR rule and report caps."""
+    """Cap numeric outliers using the IQR rule and report caps.
+
+    Quartiles, caps and capped counts for every numeric column are computed
+    in one polars ``select`` over the float columns.
+    """
+
+    if not numeric_columns or frame.empty:
+        return frame.copy(), {}
+
+    # Already coerced by _split_column_types.
+    numeric = pl.DataFrame(
+        {
+            str(index): frame[column].to_numpy(dtype=np.float64)
+            for index, column in enumerate(numeric_columns)
+        },
+        nan_to_null=True,
+    )
+    quartiles = numeric.select(
+        pl.all().quantile(0.25, "linear").name.suffix(":q1"),
+        pl.all().quantile(0.75, "linear").name.suffix(":q3"),
+    ).row(0, named=True)
 
-    capped = frame.copy()
     summary: Dict[str, Dict[str, float]] = {}
+    clips = []
+    counts = []
+    for name, column in zip(numeric.columns, numeric_columns):
+        q1, q3 = quartiles[f"{name}:q1"], quartiles[f"{name}:q3"]
+        if q1 is None:
+            lower = upper = float("nan")
+            clips.append(pl.col(name))
+        else:
+            iqr = q3 - q1
+            lower = q1 - 1.5 * iqr
+            upper = q3 + 1.5 * iqr
+            clips.append(pl.col(name).clip(lower, upper))
+        summary[column] = {"lower": lower, "upper": upper}
+        # Missing values count as capped, matching the pandas ``!=`` check.
+        counts.append(
+            (pl.col(name).is_null() | (pl.col(name) < lower) | (pl.col(name) > upper))
+            .sum()
+            .alias(name)
+        )
 
-    for column in numeric_columns:
-        series = pd.to_numeric(frame[column], errors="coerce")
-        if series.empty:
-            continue
-        q1 = series.quantile(0.25)
-        q3 = series.quantile(0.75)
-        iqr = q3 - q1
-        lower = q1 - 1.5 * iqr
-        upper = q3 + 1.5 * iqr
-        clipped = series.clip(lower=lower, upper=upper)
-        summary[column] = {
-            "lower": float(lower),
-            "upper": float(upper),
-            "capped": int((clipped != series).sum()),
-        }
-        capped[column] = clipped
+    clipped = numeric.select(clips)
+    capped_counts = numeric.select(counts).row(0, named=True)
+    for name, column in zip(numeric.columns, numeric_columns):
+        summary[column]["capped"] = int(capped_counts[name])
 
+    capped = frame.assign(
+        **{
+            column: pd.Series(
+                clipped[name].to_numpy(), index=frame.index, name=column
+            )
+            for name, column in zip(numeric.columns, numeric_columns)
+        }
+    )
     return capped, summary
 
 
 def _build_feature_matrix(
     frame: pd.DataFrame, numeric_columns: List[str], categorical_columns: List[str]
-) -> Tuple[np.ndarray, List[str]]:
-    """Fit a lightweight preprocessing pipeline and return the feature matrix."""
+) -> Tuple[Any, List[str]]:
+    """Fit a lightweight preprocessing pipeline and return the feature matrix.
+
+    The matrix stays sparse when the one-hot columns dominate it; callers
+    densify only the rows they need.
+    """
 
     transformers = []
 
@@ -130,7 +250,12 @@ def _build_feature_matrix(
                         ("imputer", SimpleImputer(strategy="most_frequent")),
                         (
                             "encoder",
-                            OneHotEncoder(handle_unknown="ignore", drop="first"),
+                            OneHotEncoder(
+                                handle_unknown="ignore",
+                                drop="first",
+                                sparse_output=True,
+                                dtype=np.float32,
+                            ),
                         ),
                     ]
                 ),
@@ -141,9 +266,6 @@ def _build_feature_matrix(
     transformer = ColumnTransformer(transformers=transformers, remainder="drop")
 
     features = transformer.fit_transform(frame)
-    if hasattr(features, "toarray"):
-        features = features.toarray()
-
     feature_names = transformer.get_feature_names_out().tolist()
     return features, feature_names
 
@@ -177,7 +299,10 @@ def build_ml_preview(frame: pd.DataFrame, *, feature_preview_rows: int = 25) ->
         capped, numeric_columns, categorical_columns
     )
 
-    preview = feature_matrix[:feature_preview_rows].tolist()
+    preview_block = feature_matrix[:feature_preview_rows]
+    if hasattr(preview_block, "toarray"):
+        preview_block = preview_block.toarray()
+    preview = preview_block.tolist()
     pipeline_steps = [
         "Preproceso: normalización de encabezados, poda de filas/columnas residuales y análisis de patrones (numérico/fecha/booleano)",
         "Numeric: median imputation + Z-score scaling",
@@ -32,11 +32,10 @@ def _discover_excel_files(paths: Iterable[Path]) -> List[Path]:
     return files
 
 
-def _summarize_excel(file_path: Path, sample_rows: int) -> None:
-    file_bytes = file_path.read_bytes()
+def _summarize_excel(file_name: str, file_bytes: bytes, sample_rows: int) -> None:
     sheets = _load_excel(file_bytes, sample_rows=sample_rows)
 
-    print(f"\n{file_path.name} ({len(sheets)} sheets)")
+    print(f"\n{file_name} ({len(sheets)} sheets)")
     for sheet in sheets:
         columns = sheet["columns"]
         column_preview = ", ".join(columns[:5])
@@ -51,9 +50,8 @@ def _summarize_excel(file_path: Path, sample_rows: int) -> None:
 
 
 def _summarize_ml_profiles(
-    file_path: Path, *, max_rows_per_sheet: int, missingness_top_k: int = 3
+    file_bytes: bytes, *, max_rows_per_sheet: int, missingness_top_k: int = 3
 ) -> None:
-    file_bytes = file_path.read_bytes()
     frames: Dict[str, pd.DataFrame] = _load_sheet_frames(
         file_bytes, max_rows_per_sheet=max_rows_per_sheet
     )
@@ -137,10 +135,12 @@ def main() -> None:
         parser.error("No Excel files found in the provided paths.")
 
     for file_path in excel_files:
-        _summarize_excel(file_path, sample_rows=args.sample_rows)
+        # Read once; both summaries parse the same bytes (and share its cache).
+        file_bytes = file_path.read_bytes()
+        _summarize_excel(file_path.name, file_bytes, sample_rows=args.sample_rows)
         if args.ml_enabled:
             _summarize_ml_profiles(
-                file_path, max_rows_per_sheet=args.ml_rows, missingness_top_k=3
+                file_bytes, max_rows_per_sheet=args.ml_rows, missingness_top_k=3
             )
 
 
@@ -0,0 +1,111 @@
+"""Regression tests for the worker's Excel readers.
+
+Run from this directory with ``python -m unittest`` (or ``pytest``).
+"""
+from __future__ import annotations
+
+import unittest
+from io import BytesIO
+
+import openpyxl
+from fastapi.testclient import TestClient
+from openpyxl.chart import BarChart, Reference
+
+import main
+
+
+def _workbook_bytes(build) -> bytes:
+    workbook = openpyxl.Workbook()
+    data = workbook.active
+    data.title = "Data"
+    data.append(["a", "b"])
+    data.append(["1", "2"])
+    build(workbook)
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _add_blank_sheet(workbook: openpyxl.Workbook) -> None:
+    workbook.create_sheet("Notes")
+
+
+def _add_chart_sheet(workbook: openpyxl.Workbook) -> None:
+    chart = BarChart()
+    chart.add_data(Reference(workbook["Data"], min_col=1, min_row=1, max_row=2))
+    workbook.create_chartsheet("Chart").add_chart(chart)
+
+
+def _add_offset_sheet(workbook: openpyxl.Workbook) -> None:
+    sheet = workbook.create_sheet("Offset")
+    sheet["C3"], sheet["D3"] = "a", "b"
+    sheet["C4"], sheet["D4"] = "1", "2"
+
+
+class CalamineSheetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = TestClient(main.app)
+
+    def _post(self, path: str, content: bytes):
+        return self.client.post(path, files={"file": ("upload.xlsx", content)})
+
+    def test_blank_worksheet_is_returned_empty(self) -> None:
+        content = _workbook_bytes(_add_blank_sheet)
+
+        for path in ("/preview", "/normalize", "/ml/pipeline"):
+            self.assertEqual(self._post(path, content).status_code, 200, path)
+
+        preview = self._post("/preview", content).json()
+        sheets = {sheet["sheet"]: sheet for sheet in preview["sheets"]}
+        self.assertEqual(list(sheets), ["Data", "Notes"])
+        self.assertEqual(sheets["Notes"]["columns"], [])
+        self.assertEqual(sheets["Notes"]["total_rows"], 0)
+
+    def test_chart_sheet_is_skipped(self) -> None:
+        content = _workbook_bytes(_add_chart_sheet)
+
+        for path in ("/preview", "/normalize", "/ml/pipeline"):
+            self.assertEqual(self._post(path, content).status_code, 200, path)
+
+        sheets = self._post("/preview", content).json()["sheets"]
+        self.assertEqual([sheet["sheet"] for sheet in sheets], ["Data"])
+        self.assertEqual(self._post("/preview?sheet=Chart", content).status_code, 404)
+
+    def test_calamine_rows_keep_leading_blank_area(self) -> None:
+        content = _workbook_bytes(_add_offset_sheet)
+
+        calamine_book = main._open_workbook(content)
+        openpyxl_book = main._open_openpyxl_workbook(content)
+        try:
+            self.assertIsInstance(calamine_book, main.CalamineWorkbook)
+            self.assertEqual(
+                main._read_sheet_rows(calamine_book, "Offset", 10),
+                main._read_sheet_rows(openpyxl_book, "Offset", 10),
+            )
+        finally:
+            main._close_workbook(calamine_book)
+            main._close_workbook(openpyxl_book)
+
+    def test_blank_first_row_is_the_header(self) -> None:
+        content = _workbook_bytes(_add_offset_sheet)
+
+        preview = self._post("/preview?sheet=Offset", content).json()
+        sheet = preview["sheets"][0]
+        # read_excel labels the blank first row and keeps the real header as data.
+        self.assertEqual(sheet["columns"], ["Unnamed: 2", "Unnamed: 3"])
+        self.assertEqual(sheet["preview_rows"][0], {"Unnamed: 2": "a", "Unnamed: 3": "b"})
+        self.assertEqual(sheet["dropped_columns"], 2)
+
+
+class ExcelHeaderTests(unittest.TestCase):
+    def test_suffixes_skip_existing_headers(self) -> None:
+        # Expected labels are what pandas.read_excel produces for these headers.
+        self.assertEqual(main._excel_header(["a", "a", "a.1"]), ["a", "a.2", "a.1"])
+        self.assertEqual(
+            main._excel_header(["a", None, "Unnamed: 1", "a.1", "a"]),
+            ["a", "Unnamed: 1.1", "Unnamed: 1", "a.1", "a.2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()